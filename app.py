@@ -5,12 +5,113 @@ A Streamlit-based web app that fetches and visualizes real-time air quality data
 from the OpenAQ API, demonstrating data engineering best practices.
 """
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
-from data_processor import fetch_aqi_data, clean_data
+from data_processor import fetch_aqi_data, clean_data, clear_fetch_cache
 from datetime import datetime, timedelta
 
+# Worker pool for running the network fetch off the Streamlit script thread
+_executor = ThreadPoolExecutor(max_workers=2)
+
+# Cap on points per chart trace — beyond this, extra samples mostly overlap
+# the same pixels while inflating the Plotly JSON payload
+MAX_CHART_POINTS = 500
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Selects indices via Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points, splits the interior into n_out - 2
+    buckets, and from each bucket keeps the point forming the largest
+    triangle with the previously kept point and the next bucket's average —
+    preserving peaks and the visual shape of the series.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    # Bucket boundaries over the interior points
+    bounds = np.linspace(1, n - 1, n_out - 1, dtype=np.intp)
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        if hi <= lo:
+            indices[i + 1] = prev = lo
+            continue
+        # Average of the following bucket (the last point for the final one)
+        next_lo = hi
+        next_hi = bounds[i + 2] if i + 2 < n_out - 1 else n
+        if next_hi > next_lo:
+            avg_x = x[next_lo:next_hi].mean()
+            avg_y = y[next_lo:next_hi].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        # Triangle areas for every candidate point in this bucket at once
+        areas = np.abs(
+            (x[prev] - avg_x) * (y[lo:hi] - y[prev])
+            - (x[prev] - x[lo:hi]) * (avg_y - y[prev])
+        )
+        prev = lo + int(areas.argmax())
+        indices[i + 1] = prev
+
+    return indices
+
+
+def _downsample_trace(trace_df: pd.DataFrame) -> pd.DataFrame:
+    """Downsamples one datetime-sorted series to MAX_CHART_POINTS rows."""
+    x = trace_df['datetime'].astype('int64').to_numpy()
+    y = trace_df['value'].to_numpy(dtype='float64')
+    return trace_df.iloc[_lttb_indices(x, y, MAX_CHART_POINTS)]
+
+
+def downsample_for_chart(viz_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downsamples chart data to at most MAX_CHART_POINTS rows per parameter.
+
+    Plot construction and browser decode time scale with the number of
+    points handed to Plotly, so long multi-location series are reduced with
+    LTTB before plotting.
+    """
+    if len(viz_df) <= MAX_CHART_POINTS:
+        return viz_df
+    if 'parameter' in viz_df.columns:
+        parts = [
+            _downsample_trace(group)
+            for _, group in viz_df.groupby('parameter', sort=False, observed=True)
+        ]
+        return pd.concat(parts) if parts else viz_df
+    return _downsample_trace(viz_df)
+
+
+# Cache API calls to avoid spamming the API. Defined at module scope so the
+# decorated function object is stable across reruns — defining it inside the
+# fetch branch would re-apply the decorator every rerun and defeat cache
+# reuse across sessions.
+@st.cache_data(ttl=300, show_spinner=False)  # Cache for 5 minutes
+def get_cached_data(city):
+    """Cached function to fetch and clean data"""
+    raw_data = fetch_aqi_data(city)
+    cleaned_data = clean_data(raw_data)
+    return cleaned_data
+
+
+@st.cache_data(ttl=600)
+def df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serializes a DataFrame to CSV bytes, cached so the O(rows x cols)
+    string formatting does not rerun on every widget interaction."""
+    return df.to_csv(index=False).encode()
+
+
 # Page configuration
 st.set_page_config(
     page_title="Air Quality Monitor",
@@ -75,6 +176,11 @@ city_to_fetch = custom_city.strip() if custom_city.strip() else selected_city
 # Fetch Data button
 fetch_button = st.sidebar.button("🔍 Fetch Data", type="primary", use_container_width=True)
 
+# Manual refresh: drop both cache layers so the next fetch hits the API
+if st.sidebar.button("🔄 Refresh Data", use_container_width=True):
+    clear_fetch_cache()
+    get_cached_data.clear()
+
 # Sidebar information
 st.sidebar.markdown("---")
 st.sidebar.info(
@@ -87,19 +193,25 @@ if fetch_button or 'data_fetched' in st.session_state:
     try:
         # Show loading spinner
         with st.spinner(f"Fetching air quality data for {city_to_fetch}..."):
-            # Use st.cache_data to cache API calls and avoid spamming the API
-            @st.cache_data(ttl=300)  # Cache for 5 minutes
-            def get_cached_data(city):
-                """Cached function to fetch and clean data"""
-                raw_data = fetch_aqi_data(city)
-                cleaned_data = clean_data(raw_data)
-                return cleaned_data
-            
-            # Fetch and clean data
-            df = get_cached_data(city_to_fetch)
+            # Run the fetch on a worker thread; the point of polling instead
+            # of calling directly is that the script thread stays free to
+            # update the UI while it waits, so feed a live elapsed-time
+            # readout to a placeholder on every tick
+            progress = st.empty()
+            started = time.monotonic()
+            future = _executor.submit(get_cached_data, city_to_fetch)
+            while not future.done():
+                progress.caption(
+                    f"Waiting for OpenAQ... {time.monotonic() - started:.0f}s"
+                )
+                time.sleep(0.05)
+            progress.empty()
+            df = future.result()
+            # Keep only lightweight scalars in session state; the DataFrame
+            # itself lives in the global st.cache_data store and reruns get
+            # it back via get_cached_data(city) as a dict lookup
             st.session_state['data_fetched'] = True
             st.session_state['current_city'] = city_to_fetch
-            st.session_state['current_data'] = df
         
         # Check if data was successfully fetched
         if df.empty:
@@ -149,55 +261,51 @@ if fetch_button or 'data_fetched' in st.session_state:
             
             # Filter for PM2.5 and NO2 if available
             if 'parameter' in df.columns and 'value' in df.columns:
-                # Get latest values for each parameter
+                # Compute the latest value per parameter in a single groupby pass
+                # instead of slicing the full DataFrame once per parameter
+                if 'datetime' in df.columns:
+                    param_latest = (
+                        df.dropna(subset=['datetime'])
+                        .sort_values('datetime')
+                        .groupby('parameter', sort=False, observed=True)['value']
+                        .last()
+                    )
+                else:
+                    param_latest = df.groupby('parameter', sort=False, observed=True)['value'].last()
+
                 metrics_col1, metrics_col2, metrics_col3, metrics_col4 = st.columns(4)
-                
+
                 # PM2.5 metric
-                pm25_data = df[df['parameter'] == 'pm25'] if 'pm25' in df['parameter'].values else None
-                if pm25_data is not None and not pm25_data.empty:
-                    latest_pm25 = pm25_data['value'].iloc[-1] if 'value' in pm25_data.columns else None
-                    if latest_pm25 is not None:
-                        with metrics_col1:
-                            st.metric(
-                                "PM2.5 (μg/m³)",
-                                f"{latest_pm25:.2f}",
-                                help="Particulate matter 2.5 micrometers or smaller"
-                            )
-                
+                latest_pm25 = param_latest.get('pm25')
+                if latest_pm25 is not None and pd.notna(latest_pm25):
+                    with metrics_col1:
+                        st.metric(
+                            "PM2.5 (μg/m³)",
+                            f"{latest_pm25:.2f}",
+                            help="Particulate matter 2.5 micrometers or smaller"
+                        )
+
                 # NO2 metric
-                no2_data = df[df['parameter'] == 'no2'] if 'no2' in df['parameter'].values else None
-                if no2_data is not None and not no2_data.empty:
-                    latest_no2 = no2_data['value'].iloc[-1] if 'value' in no2_data.columns else None
-                    if latest_no2 is not None:
-                        with metrics_col2:
+                latest_no2 = param_latest.get('no2')
+                if latest_no2 is not None and pd.notna(latest_no2):
+                    with metrics_col2:
+                        st.metric(
+                            "NO₂ (μg/m³)",
+                            f"{latest_no2:.2f}",
+                            help="Nitrogen dioxide"
+                        )
+
+                # Display up to two other available parameters
+                other_params = param_latest.index.difference(['pm25', 'no2'])[:2]
+                other_columns = [metrics_col3, metrics_col4]
+                for col_slot, param in zip(other_columns, other_params):
+                    latest_value = param_latest.get(param)
+                    if latest_value is not None and pd.notna(latest_value):
+                        with col_slot:
                             st.metric(
-                                "NO₂ (μg/m³)",
-                                f"{latest_no2:.2f}",
-                                help="Nitrogen dioxide"
+                                f"{str(param).upper()}",
+                                f"{latest_value:.2f}"
                             )
-                
-                # Display other available parameters
-                available_params = df['parameter'].unique()[:2]
-                param_idx = 0
-                for param in available_params:
-                    if param not in ['pm25', 'no2']:
-                        param_data = df[df['parameter'] == param]
-                        if not param_data.empty and 'value' in param_data.columns:
-                            latest_value = param_data['value'].iloc[-1]
-                            if param_idx == 0:
-                                with metrics_col3:
-                                    st.metric(
-                                        f"{param.upper()}",
-                                        f"{latest_value:.2f}"
-                                    )
-                                param_idx += 1
-                            elif param_idx == 1:
-                                with metrics_col4:
-                                    st.metric(
-                                        f"{param.upper()}",
-                                        f"{latest_value:.2f}"
-                                    )
-                                param_idx += 1
             else:
                 st.info("Parameter information not available in the dataset.")
             
@@ -208,15 +316,28 @@ if fetch_button or 'data_fetched' in st.session_state:
             
             # Create line chart
             if 'datetime' in df.columns and 'value' in df.columns:
-                # Prepare data for visualization
-                viz_df = df.copy()
-                
+                # Prepare data for visualization. No defensive copy needed:
+                # the slice and assign below both produce new DataFrames, so
+                # df itself is never mutated
+                viz_df = df
+
                 # Filter to last 24 hours if datetime is available
+                # (clean_data already guarantees a tz-aware datetime64 column,
+                # so no re-parse is needed here)
                 if 'datetime' in viz_df.columns:
-                    viz_df['datetime'] = pd.to_datetime(viz_df['datetime'])
-                    cutoff_time = pd.Timestamp.now() - pd.Timedelta(hours=24)
-                    viz_df = viz_df[viz_df['datetime'] >= cutoff_time]
-                
+                    # clean_data sorts by datetime, so a binary search finds
+                    # the cutoff in O(log N) instead of scanning the whole
+                    # column into a boolean mask
+                    cutoff_time = pd.Timestamp.now(tz='UTC') - pd.Timedelta(hours=24)
+                    viz_df = viz_df.iloc[viz_df['datetime'].searchsorted(cutoff_time):]
+
+                # Downsample long series so each trace stays chart-sized
+                viz_df = downsample_for_chart(viz_df)
+
+                # float32 is plenty of precision for concentrations and
+                # roughly halves the serialized chart payload
+                viz_df = viz_df.assign(value=viz_df['value'].astype('float32'))
+
                 # Create visualization
                 if not viz_df.empty and 'parameter' in viz_df.columns:
                     # Group by parameter for multi-line chart
@@ -231,7 +352,10 @@ if fetch_button or 'data_fetched' in st.session_state:
                             'value': 'Concentration (μg/m³)',
                             'parameter': 'Parameter'
                         },
-                        markers=True
+                        markers=True,
+                        # WebGL traces render on canvas instead of one SVG
+                        # DOM node per point, keeping the browser responsive
+                        render_mode='webgl'
                     )
                     
                     fig.update_layout(
@@ -254,7 +378,8 @@ if fetch_button or 'data_fetched' in st.session_state:
                             'datetime': 'Time',
                             'value': 'Concentration (μg/m³)'
                         },
-                        markers=True
+                        markers=True,
+                        render_mode='webgl'
                     )
                     
                     fig.update_layout(
@@ -277,10 +402,9 @@ if fetch_button or 'data_fetched' in st.session_state:
                 st.dataframe(df, use_container_width=True)
                 
                 # Download button
-                csv = df.to_csv(index=False)
                 st.download_button(
                     label="📥 Download Data as CSV",
-                    data=csv,
+                    data=df_to_csv_bytes(df),
                     file_name=f"air_quality_{city_to_fetch}_{datetime.now().strftime('%Y%m%d')}.csv",
                     mime="text/csv"
                 )
@@ -6,39 +6,261 @@ This module handles:
 2. Cleaning and preprocessing the data using Pandas
 """
 
+import functools
+import hashlib
 import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; stdlib json is used as fallback
+    orjson = None
 
 # Load environment variables from .env file (for local development)
 load_dotenv()
 
+# Public surface of this module; everything else is an internal helper
+__all__ = [
+    'get_api_key',
+    'fetch_aqi_data',
+    'fetch_measurements_direct',
+    'filter_by_city',
+    'clean_data',
+    'clear_fetch_cache',
+]
+
+
+def _parse_json(response) -> dict:
+    """
+    Decodes a response body with orjson when available.
+
+    orjson parses the raw bytes in native code, several times faster than
+    the stdlib parser behind response.json() on dict-heavy payloads.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _extract_results(response) -> list:
+    """
+    Returns just the results array from an OpenAQ response.
+
+    The meta/links envelope is decoded but never kept — callers get only the
+    records list, so the rest of the payload is garbage-collected
+    immediately instead of living on in a referenced dict. (A streaming
+    parser such as ijson was considered, but with orjson decoding the raw
+    bytes in native code and pages capped at 100 records the envelope cost
+    is negligible and not worth the extra dependency.)
+    """
+    return _parse_json(response).get('results', [])
+
+# Module-level session so back-to-back calls to api.openaq.org reuse the
+# same TCP+TLS connection instead of paying a fresh handshake per request.
+# Transient failures are handled here, by kind:
+# - 429 rate limits and 5xx: retried with exponential backoff, honoring the
+#   server's Retry-After header when present
+# - 422 validation errors are structural, never retried, and fall through to
+#   the next parameter strategy in fetch_measurements_direct
+_session = requests.Session()
+_session.mount(
+    'https://',
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True,
+        ),
+    ),
+)
+
+
+def _get_session(api_key: str) -> requests.Session:
+    """
+    Returns the shared session with the auth headers installed.
+
+    The headers live on the session itself, set once per process (or when
+    the key changes), instead of being rebuilt into a dict for every call.
+    """
+    if _session.headers.get('X-API-Key') != api_key:
+        # No Content-Type: these are body-less GETs. Accept-Encoding lets
+        # the API gzip the measurement JSON, which compresses several-fold
+        _session.headers.update({
+            'X-API-Key': api_key,
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+    return _session
+
+# The only response fields the pipeline actually uses, with their target
+# dtypes. Everything else the API sends (coordinates, sensor metadata, ...)
+# is dropped before building the DataFrame so construction cost scales with
+# 5 columns instead of ~15. float32 halves the value column versus inferred
+# float64; category stores the low-cardinality parameter/unit strings as
+# small integer codes. datetime stays object here (clean_data parses it to
+# datetime64) and location stays object since it can hold nested dicts
+_SCHEMA = {
+    'datetime': 'object',
+    'parameter': 'category',
+    'value': 'float32',
+    'unit': 'category',
+    'location': 'object',
+}
+_MEASUREMENT_FIELDS = tuple(_SCHEMA)
+
+
+def _use_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts plain-string object columns to pyarrow-backed strings.
+
+    Arrow strings live in one contiguous UTF-8 buffer instead of a Python
+    str object per cell, and string operations like the contains filter in
+    filter_by_city dispatch to Arrow's vectorized kernels. Left unchanged
+    when pyarrow is not installed or a column holds non-string values
+    (e.g. nested location dicts).
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return df
+    for col in df.select_dtypes(include='object').columns:
+        if col == 'datetime':
+            # Parsed straight to datetime64 in clean_data
+            continue
+        non_null = df[col].dropna()
+        if not non_null.empty and isinstance(non_null.iloc[0], str):
+            df[col] = df[col].astype('string[pyarrow]')
+    return df
+
+
+def _measurements_to_frame(measurements: list) -> pd.DataFrame:
+    """
+    Builds a DataFrame from raw measurement records, column by column.
+
+    Transposing the list-of-dicts into per-field lists first lets pandas
+    consume ready-made columns instead of running its own row-major
+    dict-of-dicts transpose, and applies the _MEASUREMENT_FIELDS projection
+    in the same pass. The explicit _SCHEMA cast skips dtype inference and
+    lands each column directly on its compact representation.
+    """
+    columns = {
+        field: [record.get(field) for record in measurements]
+        for field in _MEASUREMENT_FIELDS
+    }
+    # No copy= arguments: under copy-on-write neither call copies the data
+    # anyway, and the keyword is deprecated on pandas 3
+    return _use_arrow_strings(pd.DataFrame(columns).astype(_SCHEMA))
+
+
+# On-disk cache for fetched measurements. Streamlit's in-memory cache is
+# lost on process restart, but OpenAQ's 24-hour window changes at most
+# hourly, so results are keyed by (city, hour bucket) and stored as Parquet
+_CACHE_DIR = Path.home() / '.aqi_cache'
+
+
+def _measurements_cache_path(city: str) -> Path:
+    """Returns the cache file path for a city in the current hour bucket."""
+    hour_bucket = pd.Timestamp.now('UTC').floor('1h')
+    key = hashlib.sha1(f'{city.strip().lower()}|{hour_bucket}'.encode()).hexdigest()
+    return _CACHE_DIR / f'{key}.parquet'
+
+
+def _read_cached_measurements(city: str) -> pd.DataFrame | None:
+    """Returns the cached DataFrame for this city/hour, or None on a miss."""
+    try:
+        path = _measurements_cache_path(city)
+        if path.exists():
+            return pd.read_parquet(path)
+    except Exception:
+        # A corrupt or unreadable cache file is treated as a miss
+        pass
+    return None
+
+
+def _write_cached_measurements(city: str, df: pd.DataFrame) -> None:
+    """Stores a fetched DataFrame in the on-disk cache (best effort)."""
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(_measurements_cache_path(city), compression='zstd')
+    except Exception:
+        # Caching is an optimization only — nested columns or a missing
+        # Parquet engine should never break the fetch itself
+        pass
+
+
+# In-process TTL cache for fetch_aqi_data, keyed by normalized city name.
+# OpenAQ updates on a roughly 10-minute cadence, so repeat fetches within
+# the TTL reuse the previous DataFrame without another round-trip
+_FETCH_CACHE: dict = {}
+_FETCH_CACHE_TTL_SECONDS = 600
+_FETCH_CACHE_MAX_ENTRIES = 64
 
+
+def clear_fetch_cache() -> None:
+    """
+    Empties the fetch caches (used by the manual refresh).
+
+    Clears both the in-process TTL cache and the on-disk hour-bucket
+    Parquet cache — leaving the disk entries in place would let
+    fetch_measurements_direct serve the stale file straight back and no
+    API request would ever be made.
+    """
+    _FETCH_CACHE.clear()
+    try:
+        for path in _CACHE_DIR.glob('*.parquet'):
+            path.unlink(missing_ok=True)
+    except OSError:
+        # Best effort — an unreadable cache dir should not break the refresh
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str:
     """
     Retrieves the OpenAQ API key from multiple sources.
-    
+
     Priority order:
     1. Streamlit secrets (for Streamlit Cloud deployment)
     2. Environment variables (for local development or other platforms)
-    
+
+    The resolved key is memoized: none of the sources change during the
+    process lifetime, so only the first call pays for the secrets and
+    environment lookups. A missing key is not cached — the error is raised
+    again on every call until the key is configured.
+
     Returns:
         str: API key
-    
+
     Raises:
         ValueError: If API key is not found in any source
     """
     api_key = None
-    
-    # Try Streamlit secrets first (for Streamlit Cloud)
-    try:
-        import streamlit as st
-        if hasattr(st, 'secrets') and 'OPENAQ_API_KEY' in st.secrets:
-            api_key = st.secrets['OPENAQ_API_KEY']
-    except (ImportError, AttributeError):
-        # Streamlit not available or secrets not configured
-        pass
+
+    # Try Streamlit secrets first (for Streamlit Cloud). Checking
+    # sys.modules avoids importing streamlit in non-Streamlit contexts
+    st = sys.modules.get('streamlit')
+    if st is not None:
+        try:
+            if hasattr(st, 'secrets') and 'OPENAQ_API_KEY' in st.secrets:
+                api_key = st.secrets['OPENAQ_API_KEY']
+        except (ImportError, AttributeError):
+            # Secrets not configured
+            pass
     
     # Fallback to environment variable (for local .env file or other platforms)
     if not api_key:
@@ -75,11 +297,27 @@ def fetch_aqi_data(city: str) -> pd.DataFrame:
                      - unit: Unit of measurement
                      - location: Location name
     """
+    # Serve repeat requests for the same city from the TTL cache. Hand out
+    # a copy: clean_data takes ownership of whatever this function returns
+    # and mutates it in place, which must not corrupt the cached entry
+    cache_key = city.strip().lower()
+    cached = _FETCH_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _FETCH_CACHE_TTL_SECONDS:
+        return cached[1].copy()
+
     # Load API key from multiple sources (Streamlit secrets or environment variables)
     api_key = get_api_key()
-    
+
     # Use the direct measurements endpoint (more reliable)
-    return fetch_measurements_direct(city, api_key)
+    df = fetch_measurements_direct(city, api_key)
+
+    # Evict the oldest entry once the cache is full, then store the result.
+    # Store a private copy for the same reason as above — the returned df
+    # is owned (and mutated) by the caller
+    if len(_FETCH_CACHE) >= _FETCH_CACHE_MAX_ENTRIES:
+        _FETCH_CACHE.pop(next(iter(_FETCH_CACHE)))
+    _FETCH_CACHE[cache_key] = (time.monotonic(), df.copy())
+    return df
 
 
 def fetch_measurements_direct(city: str, api_key: str) -> pd.DataFrame:
@@ -98,17 +336,22 @@ def fetch_measurements_direct(city: str, api_key: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: DataFrame with air quality measurements
     """
-    headers = {
-        'X-API-Key': api_key,
-        'Content-Type': 'application/json'
-    }
-    
+    session = _get_session(api_key)
+
+    # Check the on-disk cache first — a hit skips the network entirely
+    cached = _read_cached_measurements(city)
+    if cached is not None:
+        return cached
+
     # Strategy 1: Get locations first, then measurements for those locations
     # This is more reliable because measurements endpoint often requires location_id
     try:
-        locations = _get_locations_for_city(city, api_key, headers)
+        locations = _get_locations_for_city(city, api_key)
         if locations:
-            return _get_measurements_for_locations(locations, api_key, headers)
+            df = _get_measurements_for_locations(locations, api_key)
+            if not df.empty:
+                _write_cached_measurements(city, df)
+            return df
     except Exception as e:
         # If location-based approach fails, try direct measurements
         pass
@@ -116,86 +359,101 @@ def fetch_measurements_direct(city: str, api_key: str) -> pd.DataFrame:
     # Strategy 2: Try direct measurements endpoint with various parameter combinations
     measurements_url = "https://api.openaq.org/v3/measurements"
     
+    # Compute the window boundaries once and share the strings between
+    # strategies instead of redoing the Timedelta arithmetic and strftime
+    # formatting per dict
+    now = pd.Timestamp.now()
+    date_from = (now - pd.Timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    date_to = now.strftime('%Y-%m-%dT%H:%M:%SZ')
+
     # Try different parameter combinations
     strategies = [
         # Try 1: Just limit (most basic)
         {'limit': 50},
         # Try 2: Limit with date_from (UTC format)
-        {
-            'limit': 50,
-            'date_from': (pd.Timestamp.now() - pd.Timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
-        },
+        {'limit': 50, 'date_from': date_from},
         # Try 3: Limit with date_from and date_to
-        {
-            'limit': 50,
-            'date_from': (pd.Timestamp.now() - pd.Timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'date_to': pd.Timestamp.now().strftime('%Y-%m-%dT%H:%M:%SZ')
-        },
+        {'limit': 50, 'date_from': date_from, 'date_to': date_to},
     ]
     
-    for i, params in enumerate(strategies, 1):
-        try:
-            response = requests.get(measurements_url, headers=headers, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                measurements = data.get('results', [])
-                if measurements:
-                    df = pd.DataFrame(measurements)
-                    df_filtered = filter_by_city(df, city)
-                    if not df_filtered.empty:
-                        return df_filtered
-                    # Return all if city filter finds nothing
-                    return df
-            
-            elif response.status_code == 422:
-                # Capture full error details for the last attempt
-                if i == len(strategies):
-                    error_data = response.json()
-                    error_details = error_data.get('errors', [])
-                    error_msg = f"API validation error (422): {error_data.get('message', 'Invalid parameters')}"
-                    if error_details:
-                        error_msg += f"\n\nDetailed Errors:\n{error_details}"
-                    error_msg += f"\n\nAttempted parameters: {params}"
-                    error_msg += f"\n\nFull response: {response.text[:500]}"
-                    raise ValueError(error_msg)
-                # Otherwise, try next strategy
-                continue
-            else:
-                response.raise_for_status()
-                
-        except requests.exceptions.RequestException as e:
-            if i == len(strategies):
-                # Last attempt failed, raise with full details
-                error_msg = f"Failed to fetch measurements after {len(strategies)} attempts: {str(e)}"
-                if hasattr(e, 'response') and e.response is not None:
-                    try:
-                        error_data = e.response.json()
-                        error_msg += f"\nAPI Response: {error_data}"
-                    except:
-                        error_msg += f"\nResponse text: {e.response.text[:300]}"
-                raise ConnectionError(error_msg)
-            continue
-    
+    # The strategies are independent, so issue them concurrently and keep
+    # the first 200 response with results — worst-case latency drops from
+    # one round-trip per failed attempt to a single round-trip
+    validation_failure = None  # (params, response) of a 422, if any
+    request_error = None       # last RequestException, if any
+    executor = ThreadPoolExecutor(max_workers=len(strategies))
+    try:
+        futures = {
+            executor.submit(session.get, measurements_url, params=params, timeout=10): params
+            for params in strategies
+        }
+        for future in as_completed(futures):
+            params = futures[future]
+            try:
+                response = future.result()
+                if response.status_code == 200:
+                    measurements = _extract_results(response)
+                    if measurements:
+                        df = _measurements_to_frame(measurements)
+                        df_filtered = filter_by_city(df, city)
+                        if not df_filtered.empty:
+                            _write_cached_measurements(city, df_filtered)
+                            return df_filtered
+                        # Return all if city filter finds nothing
+                        _write_cached_measurements(city, df)
+                        return df
+                elif response.status_code == 422:
+                    # Structural validation failure — remember it, but let
+                    # the remaining strategies finish
+                    validation_failure = (params, response)
+                else:
+                    response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                request_error = e
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # No strategy produced data — surface the most informative failure
+    if validation_failure is not None:
+        params, response = validation_failure
+        error_data = _parse_json(response)
+        error_details = error_data.get('errors', [])
+        error_msg = f"API validation error (422): {error_data.get('message', 'Invalid parameters')}"
+        if error_details:
+            error_msg += f"\n\nDetailed Errors:\n{error_details}"
+        error_msg += f"\n\nAttempted parameters: {params}"
+        error_msg += f"\n\nFull response: {response.text[:500]}"
+        raise ValueError(error_msg)
+
+    if request_error is not None:
+        error_msg = f"Failed to fetch measurements after {len(strategies)} attempts: {str(request_error)}"
+        if hasattr(request_error, 'response') and request_error.response is not None:
+            try:
+                error_data = _parse_json(request_error.response)
+                error_msg += f"\nAPI Response: {error_data}"
+            except:
+                error_msg += f"\nResponse text: {request_error.response.text[:300]}"
+        raise ConnectionError(error_msg)
+
     # If all strategies failed
     return pd.DataFrame(columns=['datetime', 'parameter', 'value', 'unit', 'location'])
 
 
-def _get_locations_for_city(city: str, api_key: str, headers: dict) -> list:
+def _get_locations_for_city(city: str, api_key: str) -> list:
     """
     Helper function to get location IDs for a city.
     Uses locations endpoint with minimal parameters.
     """
+    session = _get_session(api_key)
     locations_url = "https://api.openaq.org/v3/locations"
     
     # Try with just limit first
     params = {'limit': 20}
     
     try:
-        response = requests.get(locations_url, headers=headers, params=params, timeout=10)
+        response = session.get(locations_url, params=params, timeout=10)
         if response.status_code == 200:
-            data = response.json()
-            locations = data.get('results', [])
+            locations = _extract_results(response)
             # Filter locations by city name in the response
             city_locations = []
             for loc in locations:
@@ -212,38 +470,48 @@ def _get_locations_for_city(city: str, api_key: str, headers: dict) -> list:
     return []
 
 
-def _get_measurements_for_locations(locations: list, api_key: str, headers: dict) -> pd.DataFrame:
+def _get_measurements_for_locations(locations: list, api_key: str) -> pd.DataFrame:
     """
     Helper function to get measurements for specific locations.
+
+    The per-location requests are independent I/O waits, so they are issued
+    concurrently over the pooled session — total wall-clock time is roughly
+    one round-trip instead of one per location.
     """
+    session = _get_session(api_key)
     measurements_url = "https://api.openaq.org/v3/measurements"
-    all_measurements = []
-    
+
     date_from = (pd.Timestamp.now() - pd.Timedelta(days=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
-    
+
+    location_ids = []
     for loc in locations:
         location_id = loc.get('id') if isinstance(loc, dict) else loc
-        if not location_id:
-            continue
-            
+        if location_id:
+            location_ids.append(location_id)
+
+    def _fetch_one(location_id):
         params = {
             'location_id': location_id,
             'limit': 100,
             'date_from': date_from
         }
-        
         try:
-            response = requests.get(measurements_url, headers=headers, params=params, timeout=10)
+            response = session.get(measurements_url, params=params, timeout=10)
             if response.status_code == 200:
-                data = response.json()
-                measurements = data.get('results', [])
-                all_measurements.extend(measurements)
-        except:
-            continue
-    
+                return _extract_results(response)
+        except Exception:
+            pass
+        return []
+
+    all_measurements = []
+    if location_ids:
+        with ThreadPoolExecutor(max_workers=min(4, len(location_ids))) as executor:
+            for results in executor.map(_fetch_one, location_ids):
+                all_measurements.extend(results)
+
     if all_measurements:
-        return pd.DataFrame(all_measurements)
-    
+        return _measurements_to_frame(all_measurements)
+
     return pd.DataFrame(columns=['datetime', 'parameter', 'value', 'unit', 'location'])
 
 
@@ -264,94 +532,162 @@ def filter_by_city(df: pd.DataFrame, city: str) -> pd.DataFrame:
         return df
     
     # Try different possible location field structures
-    city_lower = city.lower()
+    # (casefold once; every branch below reuses the same needle)
+    city_lower = city.casefold()
     
     # Check if location is a nested dictionary
     if 'location' in df.columns and len(df) > 0:
         first_location = df['location'].iloc[0]
         if isinstance(first_location, dict):
-            # Extract location name from nested dict
-            if 'name' in first_location:
-                city_filter = df['location'].apply(
-                    lambda x: city_lower in str(x.get('name', '')).lower() if isinstance(x, dict) else False
-                )
-                return df[city_filter]
-            elif 'city' in first_location:
-                city_filter = df['location'].apply(
-                    lambda x: city_lower in str(x.get('city', '')).lower() if isinstance(x, dict) else False
-                )
-                return df[city_filter]
+            # Flatten the nested dicts into columns once, then filter with a
+            # vectorized substring match instead of dispatching a Python
+            # lambda per row
+            loc = pd.json_normalize(df['location'])
+            for key in ('name', 'city'):
+                if key in loc.columns:
+                    # regex=False: the city name is a literal, so pandas can
+                    # use plain C substring search instead of compiling a
+                    # regex; case=False folds case in the same pass
+                    # astype('string') keeps missing names as NA instead of
+                    # the literal 'nan' that astype(str) would produce
+                    city_filter = loc[key].astype('string').str.contains(
+                        city_lower, case=False, na=False, regex=False
+                    )
+                    return df[city_filter.values]
     
     # Check for locationName column
+    # astype('string') keeps NA as NA (astype(str) would stringify missing
+    # values into a matchable 'nan') and keeps the match in one pass
     if 'locationName' in df.columns:
-        city_filter = df['locationName'].astype(str).str.lower().str.contains(city_lower, na=False)
+        city_filter = df['locationName'].astype('string').str.contains(
+            city_lower, case=False, na=False, regex=False
+        )
         return df[city_filter]
-    
+
     # Check if location is a simple string column
     if 'location' in df.columns:
-        city_filter = df['location'].astype(str).str.lower().str.contains(city_lower, na=False)
+        city_filter = df['location'].astype('string').str.contains(
+            city_lower, case=False, na=False, regex=False
+        )
         return df[city_filter]
     
     # If no location filtering possible, return original DataFrame
     return df
 
 
-def clean_data(df: pd.DataFrame) -> pd.DataFrame:
+def clean_data(df: pd.DataFrame, copy: bool = False) -> pd.DataFrame:
     """
     Cleans and preprocesses air quality data.
-    
+
     Cleaning steps:
     1. Remove duplicate timestamps (keep first occurrence)
     2. Convert date columns to Python datetime objects
     3. Handle missing values using mean imputation
-    
+
+    Note on ownership: by default this function takes ownership of df and
+    may modify its columns in place — callers that still need the raw
+    DataFrame afterwards must pass copy=True. The fetch_* functions hand
+    over freshly built DataFrames, so the default avoids a full clone.
+
     Args:
         df (pd.DataFrame): Raw DataFrame from API
-    
+        copy (bool): If True, work on a copy and leave df untouched.
+                     Defaults to False since callers pass a freshly built
+                     DataFrame from the API with no other owner, which
+                     avoids doubling peak memory during cleaning.
+
     Returns:
         pd.DataFrame: Cleaned DataFrame ready for visualization
     """
     if df.empty:
         return df
-    
-    # Create a copy to avoid modifying original DataFrame
-    df_clean = df.copy()
+
+    df_clean = df.copy() if copy else df
     
     # Step 1: Remove duplicate timestamps
     # This ensures we have one measurement per timestamp, avoiding data redundancy
     if 'datetime' in df_clean.columns:
-        # Convert to datetime first to properly identify duplicates
-        df_clean['datetime'] = pd.to_datetime(df_clean['datetime'], errors='coerce')
+        # Parse once with the known ISO-8601 format so pandas uses its fast
+        # C parser instead of per-cell dateutil inference; utc=True gives a
+        # consistent tz-aware dtype for downstream comparisons
+        df_clean['datetime'] = pd.to_datetime(
+            df_clean['datetime'], format='ISO8601', utc=True, errors='coerce'
+        )
         # Remove duplicates based on datetime and parameter (if available)
         if 'parameter' in df_clean.columns:
-            df_clean = df_clean.drop_duplicates(
-                subset=['datetime', 'parameter'], 
-                keep='first'
+            # Encode parameter as Categorical before dedup so duplicate
+            # detection runs on small integer codes rather than hashing a
+            # Python string per row; the (datetime, parameter) pair then
+            # packs into a single uint64 key: the int64 timestamp XORed
+            # with the category code shifted into the high bits.
+            # np.unique on that key is one C pass, versus drop_duplicates
+            # hashing a Python tuple per row
+            # Guard on "not already Categorical" rather than "is object":
+            # on newer pandas the column arrives as str/pyarrow-string
+            # dtype, which also needs the cast before .cat.codes
+            if not isinstance(df_clean['parameter'].dtype, pd.CategoricalDtype):
+                df_clean['parameter'] = df_clean['parameter'].astype('category')
+            key = (
+                df_clean['datetime'].values.view('i8').astype('u8')
+                ^ (df_clean['parameter'].cat.codes.values.astype('u8') << 48)
             )
+            _, idx = np.unique(key, return_index=True)
+            # .take (not .iloc) so the result is a standalone frame, not one
+            # tagged as a slice of the caller's — later frame-level
+            # assignments would trip SettingWithCopyWarning otherwise
+            df_clean = df_clean.take(np.sort(idx))
         else:
             df_clean = df_clean.drop_duplicates(subset=['datetime'], keep='first')
     
-    # Step 2: Convert date columns to Python datetime objects
+    # Step 2: Convert remaining date columns to Python datetime objects
     # This enables time-based operations and filtering
-    date_columns = ['datetime', 'date', 'date.utc', 'dateLocal']
+    # ('datetime' was already parsed above and is not re-parsed here)
+    date_columns = ['date', 'date.utc', 'dateLocal']
     for col in date_columns:
-        if col in df_clean.columns:
-            df_clean[col] = pd.to_datetime(df_clean[col], errors='coerce')
+        if col in df_clean.columns and not pd.api.types.is_datetime64_any_dtype(df_clean[col]):
+            # Same fast ISO8601 path as the datetime column; the dtype guard
+            # avoids re-parsing columns that are already datetime64
+            df_clean[col] = pd.to_datetime(
+                df_clean[col], format='ISO8601', utc=True, errors='coerce'
+            )
     
     # Step 3: Handle missing values using mean imputation
-    # This preserves the dataset size while filling gaps in numeric columns
-    numeric_columns = df_clean.select_dtypes(include=['float64', 'int64']).columns
-    
-    for col in numeric_columns:
-        if df_clean[col].isna().any():
-            # Calculate mean of the column (excluding NaN values)
-            mean_value = df_clean[col].mean()
-            # Fill missing values with the mean
-            df_clean[col].fillna(mean_value, inplace=True)
-    
-    # Sort by datetime for better visualization
+    # This preserves the dataset size while filling gaps in numeric columns.
+    # All column means are computed in one vectorized pass and fillna is
+    # applied column-wise in C, instead of looping over columns in Python
+    # include='number' also catches float32/Int64 etc., so columns that get
+    # downsized for memory reasons are still imputed
+    numeric_columns = df_clean.select_dtypes(include='number').columns
+    if len(numeric_columns) > 0:
+        means = df_clean[numeric_columns].mean(numeric_only=True)
+        df_clean[numeric_columns] = df_clean[numeric_columns].fillna(means)
+    
+    # Sort by datetime for better visualization. The API returns each page
+    # already ordered, so the concatenation of per-location pages is nearly
+    # sorted — mergesort is adaptive (near-linear) on such input, and
+    # ignore_index avoids a separate reset_index allocation
     if 'datetime' in df_clean.columns:
-        df_clean = df_clean.sort_values('datetime', ascending=True)
-    
+        df_clean = df_clean.sort_values(
+            'datetime', ascending=True, kind='mergesort', ignore_index=True
+        )
+
+    # Step 4: Convert low-cardinality text columns to Categorical
+    # Equality masks and groupby then operate on small integer codes instead
+    # of Python strings, and memory per cell drops to roughly one byte
+    for col in ('parameter', 'unit', 'location'):
+        if col not in df_clean.columns:
+            continue
+        # Covers object dtype and the str/pyarrow-string dtypes newer pandas
+        # builds text columns with
+        if not (pd.api.types.is_object_dtype(df_clean[col])
+                or pd.api.types.is_string_dtype(df_clean[col])):
+            continue
+        # The location column can hold nested dicts from the API;
+        # only plain strings can be encoded as categories
+        non_null = df_clean[col].dropna()
+        if not non_null.empty and not isinstance(non_null.iloc[0], str):
+            continue
+        df_clean[col] = df_clean[col].astype('category')
+
     return df_clean
 